@@ -0,0 +1,85 @@
+"""Measure per-instance memory of YAMLParams objects.
+
+Usage::
+
+    python benchmarks/bench_memory.py [count]
+
+Loads ``count`` objects in the default mode and with ``compact=True`` and
+reports the traced allocation per object for two cases:
+
+* same file: every object loads tests/inputs/my_obj.yaml, the best case for
+  sharing;
+* varied files: every object loads its own copy of that file with different
+  params values, so only keys, unchanged values and unchanged subtrees can
+  be shared, and each object keeps its own source text.
+"""
+
+import gc
+import os
+import sys
+import tempfile
+import tracemalloc
+
+REPO_DIR = os.path.join(os.path.dirname(os.path.abspath(__file__)), os.pardir)
+sys.path.insert(0, REPO_DIR)
+
+from yaml_params import YAMLParams  # noqa: E402  pylint: disable=C0413
+
+INPUT_FILE = os.path.join(REPO_DIR, 'tests', 'inputs', 'my_obj.yaml')
+
+
+def write_varied_files(directory, count):
+    """Write count copies of the input file with different params values."""
+    with open(INPUT_FILE, 'r', encoding="utf-8") as fh:  # pylint: disable=C0103
+        text = fh.read()
+    paths = []
+    for i in range(count):
+        varied = (text
+                  .replace('myint: 42', f'myint: {i}')
+                  .replace('myfloat: 2.718281828', f'myfloat: {i * 0.5}')
+                  .replace('"this is a string"', f'"run {i}"')
+                  .replace('[4.0, 5.0, 6.0]', f'[{i}.0, 5.0, 6.0]'))
+        path = os.path.join(directory, f'run_{i}.yaml')
+        with open(path, 'w', encoding="utf-8") as fh:  # pylint: disable=C0103
+            fh.write(varied)
+        paths.append(path)
+    return paths
+
+
+def bytes_per_instance(paths, compact):
+    """Return traced bytes per YAMLParams object kept alive."""
+    gc.collect()
+    tracemalloc.start()
+    start, _ = tracemalloc.get_traced_memory()
+    objs = []
+    for path in paths:
+        obj = YAMLParams('bench', load_file=False, compact=compact)
+        obj.read_params_config(config_file=path)
+        objs.append(obj)
+    gc.collect()
+    end, _ = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+    del objs
+    return (end - start) / len(paths)
+
+
+def report(label, paths):
+    """Print the per-instance memory of both modes and their ratio."""
+    default = bytes_per_instance(paths, compact=False)
+    compact = bytes_per_instance(paths, compact=True)
+    print(f"{label}:")
+    print(f"  default  bytes/obj: {default:10.0f}")
+    print(f"  compact  bytes/obj: {compact:10.0f}")
+    print(f"  reduction:          {default / compact:10.1f}x")
+
+
+def main(count=1000):
+    """Run both cases with count objects each."""
+    print(f"objects: {count}")
+    report("same file", [INPUT_FILE] * count)
+    with tempfile.TemporaryDirectory() as directory:
+        report("varied files", write_varied_files(directory, count))
+
+
+if __name__ == '__main__':
+    main(*[int(arg) for arg in sys.argv[1:2]])
@@ -29,6 +29,11 @@ setup(
         'Programming Language :: Python :: 3.8',
     ],
     description="Objects with parameters that are YAML-able.",
+    entry_points={
+        'console_scripts': [
+            'yaml-params=yaml_params.cli:main',
+        ],
+    },
     install_requires=requirements,
     license="MIT license",
     long_description=readme + '\n\n' + history,
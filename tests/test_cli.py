@@ -0,0 +1,117 @@
+"""Tests for `yaml_params.cli` module."""
+import json
+import os
+import shutil
+import filecmp
+import pytest
+from yaml_params import YAMLParams
+from yaml_params.cli import main
+
+INPUT_FILE = os.path.join('tests', 'inputs', 'my_obj.yaml')
+
+
+@pytest.fixture
+def tree(tmp_path):
+    """Directory holding two copies of the test input."""
+    (tmp_path / 'sub').mkdir()
+    shutil.copy(INPUT_FILE, str(tmp_path / 'a.yaml'))
+    shutil.copy(INPUT_FILE, str(tmp_path / 'sub' / 'b.yaml'))
+    return tmp_path
+
+def test_cli_requires_command():
+    """Test that a subcommand is required."""
+    with pytest.raises(SystemExit):
+        main([])
+
+def test_cli_check(tree, capsys):
+    assert main(['check', '-j', '1', str(tree)]) == 0
+    out, err = capsys.readouterr()
+    assert out.count(' ms ') == 2
+    assert '2 files, 0 failed' in err
+
+def test_cli_check_invalid(tree, capsys):
+    (tree / 'bad.yaml').write_text('- 1\n')
+    assert main(['check', '-j', '1', '-q', str(tree)]) == 1
+    out, err = capsys.readouterr()
+    assert 'bad.yaml' in out
+    assert 'a.yaml' not in out
+    assert '3 files, 1 failed' in err
+
+def test_cli_check_process_pool(tree, capsys):
+    assert main(['check', '-j', '2', str(tree)]) == 0
+    _, err = capsys.readouterr()
+    assert '2 files, 0 failed' in err
+    assert '2 jobs' in err
+
+def test_cli_fmt(tree, capsys):
+    path = str(tree / 'a.yaml')
+    assert main(['fmt', '-j', '1', path]) == 0
+    assert 'unchanged' in capsys.readouterr()[0]
+    with open(path, encoding="utf-8") as fh:
+        text = fh.read()
+    with open(path, 'w', encoding="utf-8") as fh:
+        fh.write(text.replace('  myint: 42', '  myint:     42'))
+    assert main(['fmt', '--check', '-j', '1', path]) == 1
+    assert main(['fmt', '-j', '1', path]) == 0
+    assert 'formatted' in capsys.readouterr()[0]
+    assert filecmp.cmp(path, INPUT_FILE)
+
+def test_cli_get_set(tree, capsys):
+    path = str(tree / 'a.yaml')
+    assert main(['set', '-j', '1', 'mydict.myint', '99', path]) == 0
+    assert main(['set', '-j', '1', 'mydict.myfloatarray.1', '5.5', path]) == 0
+    assert YAMLParams('a', config_dir=str(tree)).params['mydict']['myint'] == 99
+    capsys.readouterr()
+    assert main(['get', '-j', '1', 'mydict.myfloatarray', path]) == 0
+    assert '[4.0, 5.5, 6.0]' in capsys.readouterr()[0]
+    assert main(['get', '-j', '1', 'mydict.nokey', path]) == 1
+
+def test_cli_diff(tree, tmp_path_factory, capsys):
+    other = tmp_path_factory.mktemp('other')
+    shutil.copytree(str(tree / 'sub'), str(other / 'sub'))
+    assert main(['set', '-j', '1', 'myint', '1', str(other / 'sub' / 'b.yaml')]) == 0
+    capsys.readouterr()
+    assert main(['diff', '-j', '1', str(tree / 'sub' / 'b.yaml'), INPUT_FILE]) == 0
+    assert main(['diff', '-j', '1', str(tree), str(other)]) == 1
+    out, _ = capsys.readouterr()
+    assert 'missing' in out
+    assert '~ myint: 42 -> 1' in out
+    assert main(['diff', str(tree), INPUT_FILE]) == 2
+
+def test_cli_convert(tree):
+    assert main(['convert', '--to', 'json', '-j', '1', str(tree / 'a.yaml')]) == 0
+    with open(str(tree / 'a.json'), encoding="utf-8") as fh:
+        data = json.load(fh)
+    assert data['info']['name'] == 'my_name'
+    assert data['params'] == YAMLParams('a', config_dir=str(tree)).params
+    os.remove(str(tree / 'a.yaml'))
+    assert main(['convert', '--to', 'yaml', '-j', '1', str(tree)]) == 0
+    assert YAMLParams('a', config_dir=str(tree)).params == data['params']
+
+def test_cli_jobs_validated(tree, capsys):
+    """Test that negative job counts are rejected and 0 means CPU count."""
+    with pytest.raises(SystemExit):
+        main(['check', '-j', '-3', str(tree)])
+    assert 'invalid job count' in capsys.readouterr()[1]
+    assert main(['check', '-j', '0', str(tree)]) == 0
+
+def test_cli_check_invalid_info(tree, capsys):
+    (tree / 'bad.yaml').write_text('info: 3\nparams: {}\n')
+    assert main(['check', '-j', '1', '-q', str(tree / 'bad.yaml')]) == 1
+    assert '"info" is not a mapping' in capsys.readouterr()[0]
+
+def test_cli_convert_keeps_existing_target(tree, capsys):
+    """Test that convert does not overwrite existing files without --force."""
+    path = str(tree / 'a.yaml')
+    assert main(['convert', '--to', 'json', '-j', '1', path]) == 0
+    assert main(['set', '-j', '1', 'myint', '7', path]) == 0
+    with open(path, encoding="utf-8") as fh:
+        text = fh.read()
+    capsys.readouterr()
+    assert main(['convert', '--to', 'yaml', '-j', '1', str(tree / 'a.json')]) == 1
+    assert 'exists' in capsys.readouterr()[0]
+    with open(path, encoding="utf-8") as fh:
+        assert fh.read() == text
+    assert main(['convert', '--to', 'yaml', '--force', '-j', '1',
+                 str(tree / 'a.json')]) == 0
+    assert YAMLParams('a', config_dir=str(tree)).params['myint'] == 42
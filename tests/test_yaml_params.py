@@ -5,6 +5,7 @@ from collections import OrderedDict
 from yaml_params import YAMLParams
 from datetime import datetime
 import filecmp
+import shutil
 
 def test_init_assert_noargs():
     """Test to make sure YAMLParams asserts when no name argument."""
@@ -217,3 +218,146 @@ def test_manual_set_params():
        f"  mylistofbools: [false, true, false, false, true]\n"
        f"  mylistofstrs: [one, two, three and four, five]\n"
     )
+
+def test_compact_shares_subtrees():
+    """Compact objects loaded from the same file share read-only subtrees."""
+    obj_a = YAMLParams('my_obj', config_dir='tests/inputs', compact=True)
+    obj_b = YAMLParams('my_obj', config_dir='tests/inputs', compact=True)
+    assert obj_a.params == obj_b.params
+    assert obj_a.params is not obj_b.params
+    assert obj_a.params['mydict'] is obj_b.params['mydict']
+    assert obj_a._engine() is obj_b._engine()
+    assert obj_a._params_yaml is None
+    with pytest.raises(TypeError):
+        obj_a.params['mydict']['myint'] = 1
+    with pytest.raises(TypeError):
+        obj_a.params['myintarray'].append(4)
+
+def test_compact_unshare():
+    """unshare() gives one compact object an editable copy of a subtree."""
+    obj_a = YAMLParams('my_obj', config_dir='tests/inputs', compact=True)
+    obj_b = YAMLParams('my_obj', config_dir='tests/inputs', compact=True)
+    obj_a.unshare('mydict')['myint'] = 1
+    assert obj_a.params['mydict']['myint'] == 1
+    assert obj_b.params['mydict']['myint'] == 72
+
+def test_compact_edit_string_w_comment():
+    """Compact objects keep comments when saved."""
+    myObj = YAMLParams('my_obj', config_dir='tests/inputs', compact=True)
+    myObj.params['mystring'] = 'this is a string, modified'
+    myObj.save_params_yaml(filepath=os.path.join(os.path.curdir,'my_obj_saved.yaml'))
+    assert filecmp.cmp('my_obj_saved.yaml',
+                       './tests/expected_outputs/my_obj_mod_mystring.yaml')
+    assert myObj._params_yaml is None
+    os.remove('my_obj_saved.yaml')
+
+def test_compact_w_params_dict():
+    """Compact objects initialized from a dict match non-compact ones."""
+    my_params = {'myfloat':1.234,
+                 'mystr':'this is a string.',
+                 'mylistoffloats':[1.2,3.4,5.6],
+                 'mydict':{'myint': 1, 'myzero': -0.0}
+                 }
+    my_obj = YAMLParams("my_obj", params=my_params, compact=True)
+    ref_obj = YAMLParams("my_obj", params=my_params)
+    assert my_obj.params == my_params
+    my_obj.capture_params()
+    assert my_obj._params_yaml is None
+    assert my_obj.dump_params_yaml() == ref_obj.dump_params_yaml()
+
+def test_compact_source_file_changed(tmp_path):
+    """Compact objects dump their own data after the source file changes."""
+    shutil.copy('tests/inputs/my_obj.yaml', str(tmp_path / 'my_obj.yaml'))
+    my_obj = YAMLParams('my_obj', config_dir=str(tmp_path), compact=True)
+    ref_obj = YAMLParams('my_obj', config_dir=str(tmp_path))
+    expected = ref_obj.dump_params_yaml()
+    with open(str(tmp_path / 'my_obj.yaml'), 'a', encoding="utf-8") as fh:
+        fh.write('  injected: 1\n')
+    assert my_obj.dump_params_yaml() == expected
+    os.remove(str(tmp_path / 'my_obj.yaml'))
+    assert my_obj.dump_params_yaml() == expected
+
+def test_compact_shares_info():
+    """Compact objects loaded from identical files share one info block."""
+    obj_a = YAMLParams('my_obj', config_dir='tests/inputs', compact=True)
+    obj_b = YAMLParams('my_obj', config_dir='tests/inputs', compact=True)
+    assert obj_a._info is obj_b._info
+    assert obj_a._source_text is obj_b._source_text
+
+def test_compact_dump_threads():
+    """Compact objects can be dumped from several threads at once."""
+    from concurrent.futures import ThreadPoolExecutor
+    objs = [YAMLParams('my_obj', config_dir='tests/inputs', compact=True)
+            for _ in range(8)]
+    for i, obj in enumerate(objs):
+        obj.params['myint'] = i
+    expected = [obj.dump_params_yaml() for obj in objs]
+    with ThreadPoolExecutor(max_workers=4) as executor:
+        for _ in range(5):
+            assert list(executor.map(YAMLParams.dump_params_yaml, objs)) == expected
+
+def test_init_w_config_file():
+    """Test loading a file whose name is not [name].yaml."""
+    my_obj = YAMLParams('other', config_file='tests/inputs/my_obj.yaml')
+    assert my_obj._name == 'my_obj'
+    assert my_obj.params == YAMLParams('my_obj', config_dir='tests/inputs').params
+
+def test_init_assert_configfile_not_string():
+    """Test to make sure that the config_file arg is a string."""
+    with pytest.raises(TypeError):
+        myObj = YAMLParams("my_name", config_file=42)
+
+@pytest.mark.parametrize('compact', [False, True])
+def test_info_set_info(compact):
+    """Test reading and replacing the info block."""
+    my_obj = YAMLParams('my_obj', config_dir='tests/inputs', compact=compact)
+    info = my_obj.info
+    assert info['author'] == 'esbailey@me.com'
+    info['author'] = 'someone else'
+    assert my_obj.info['author'] == 'esbailey@me.com'
+    del info['date']
+    my_obj.set_info(info)
+    assert my_obj.info == info
+    assert my_obj.dump_params_yaml().startswith(
+        '# Summary information\n'
+        'info:\n  name: "my_name"\n'
+        '  version: "v1.0.0"\n'
+        '  author: "someone else"\n'
+        '  description: "Test parametters for developing YAMLParams class."\n'
+        '\n'
+        '# Parameters for use by simualation\n'
+    )
+    with pytest.raises(TypeError):
+        my_obj.set_info(42)
+
+def test_package_lazy_import():
+    """Test that the package imports ruamel.yaml only on first use."""
+    import subprocess
+    import sys
+    code = ('import sys, yaml_params\n'
+            'assert "ruamel.yaml" not in sys.modules\n'
+            'assert yaml_params.yaml_params.YAMLParams is yaml_params.YAMLParams\n'
+            'assert "YAMLParams" in vars(yaml_params)\n')
+    subprocess.run([sys.executable, '-c', code], check=True)
+
+def test_compact_keeps_scalar_formatting(tmp_path):
+    """Compact objects only share values that dump identically."""
+    (tmp_path / 'a.yaml').write_text('params:\n  arr: [1.0, 2.0]\n  z: [0.0]\n'
+                                     '  w: [7]\n')
+    (tmp_path / 'b.yaml').write_text('params:\n  arr: [1.00, 2.000]\n  z: [-0.0]\n'
+                                     '  w: [007]\n')
+    obj_a = YAMLParams('a', config_dir=str(tmp_path), compact=True)
+    obj_b = YAMLParams('b', config_dir=str(tmp_path), compact=True)
+    assert obj_b.params['arr'] is not obj_a.params['arr']
+    assert str(obj_b.params['z'][0]) == '-0.0'
+    assert obj_b.dump_params_yaml() == (
+        'params:\n  arr: [1.00, 2.000]\n  z: [-0.0]\n  w: [007]\n')
+
+def test_compact_keeps_key_types(tmp_path):
+    """Compact objects do not share subtrees whose keys only compare equal."""
+    (tmp_path / 'a.yaml').write_text('params:\n  d: {1: x}\n')
+    (tmp_path / 'b.yaml').write_text('params:\n  d: {true: x}\n')
+    obj_a = YAMLParams('a', config_dir=str(tmp_path), compact=True)
+    obj_b = YAMLParams('b', config_dir=str(tmp_path), compact=True)
+    assert [type(key) for key in obj_a.params['d']] == [int]
+    assert [type(key) for key in obj_b.params['d']] == [bool]
@@ -1,7 +1,22 @@
 """Top-level package for YAML Params."""
 
+import sys
+import importlib
+
 __author__ = """Erik S. Bailey"""
 __email__ = 'esbailey@me.com'
 __version__ = '0.2.0'
 
-from .yaml_params import YAMLParams
\ No newline at end of file
+__all__ = ['YAMLParams']
+
+if sys.version_info >= (3, 7):
+    def __getattr__(name):
+        """Import YAMLParams (and ruamel.yaml) on first use."""
+        if name not in ('YAMLParams', 'yaml_params'):
+            raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+        module = importlib.import_module('.yaml_params', __name__)
+        globals()['yaml_params'] = module
+        globals()['YAMLParams'] = module.YAMLParams
+        return globals()[name]
+else:
+    from .yaml_params import YAMLParams
@@ -0,0 +1,400 @@
+"""Command-line tool for batch work on YAMLParams files.
+
+Run ``yaml-params --help`` for the list of subcommands.  Files are processed
+in a process pool; ruamel.yaml, json and the pool machinery are only imported
+once there is work to do, so start-up stays cheap.
+"""
+
+import argparse
+import os
+import sys
+import time
+
+YAML_EXTENSIONS = ('.yaml', '.yml')
+JSON_EXTENSIONS = ('.json', )
+
+
+# Helpers used by the worker functions
+
+def _load(path, compact=False):
+    """Load and validate a YAMLParams file.
+
+    Raises
+    ------
+    ValueError
+        Raised if the file is not a mapping with a "params" mapping and an
+        optional "info" mapping.
+    """
+    from .yaml_params import YAMLParams  # pylint: disable=C0415
+
+    name = os.path.basename(path).split('.')[0]
+    try:
+        obj = YAMLParams(name, config_file=path, compact=compact)
+    except (KeyError, TypeError) as err:
+        raise ValueError('expected a mapping with a "params" key') from err
+    if not isinstance(obj.params, dict):
+        raise ValueError('"params" is not a mapping')
+    if not isinstance(obj.info, dict):
+        raise ValueError('"info" is not a mapping')
+    return obj
+
+
+def _split_path(dotted):
+    """Split a dotted params path, e.g. "mydict.myfloatarray.0"."""
+    keys = dotted.split('.')
+    if not all(keys):
+        raise ValueError(f'invalid dotted path "{dotted}"')
+    return keys
+
+
+def _child(obj, key, dotted):
+    """Return obj[key], indexing lists by integer."""
+    try:
+        if isinstance(obj, list):
+            return obj[int(key)]
+        return obj[key]
+    except (KeyError, IndexError, ValueError, TypeError) as err:
+        raise KeyError(f'"{dotted}" not found in params') from err
+
+
+def _get(params, dotted):
+    value = params
+    for key in _split_path(dotted):
+        value = _child(value, key, dotted)
+    return value
+
+
+def _set(params, dotted, value):
+    keys = _split_path(dotted)
+    parent = params
+    for key in keys[:-1]:
+        parent = _child(parent, key, dotted)
+    if isinstance(parent, list):
+        _child(parent, keys[-1], dotted)
+        parent[int(keys[-1])] = value
+    elif isinstance(parent, dict):
+        parent[keys[-1]] = value
+    else:
+        raise KeyError(f'"{dotted}" does not point into a mapping or list')
+
+
+def _format_value(value):
+    """Format a params value for display."""
+    if isinstance(value, (dict, list)):
+        import json  # pylint: disable=C0415
+        return json.dumps(value, default=str)
+    return str(value)
+
+
+def _flatten(obj, prefix=''):
+    """Map dotted paths to leaf values; lists are compared as leaves."""
+    if isinstance(obj, dict) and obj:
+        flat = {}
+        for key, item in obj.items():
+            flat.update(_flatten(item, f'{prefix}{key}.'))
+        return flat
+    return {prefix[:-1]: obj}
+
+
+# Worker functions.  Each returns (ok, status, message).
+
+def check_file(path):
+    """Parse and validate one file."""
+    _load(path)
+    return True, 'ok', ''
+
+
+def fmt_file(path, check_only=False):
+    """Round-trip one file, rewriting it only if the output differs."""
+    obj = _load(path)
+    new_text = obj.dump_params_yaml()
+    with open(path, 'r', encoding="utf-8") as fh:  # pylint: disable=C0103
+        old_text = fh.read()
+    if new_text == old_text:
+        return True, 'unchanged', ''
+    if check_only:
+        return False, 'changed', ''
+    with open(path, 'w', encoding="utf-8") as fh:  # pylint: disable=C0103
+        fh.write(new_text)
+    return True, 'formatted', ''
+
+
+def diff_files(left, right):
+    """Compare the params of two files."""
+    left_params = _flatten(_load(left, compact=True).params)
+    right_params = _flatten(_load(right, compact=True).params)
+    lines = []
+    for key in left_params:
+        if key not in right_params:
+            lines.append(f'- {key}: {_format_value(left_params[key])}')
+        elif left_params[key] != right_params[key]:
+            lines.append(f'~ {key}: {_format_value(left_params[key])} -> '
+                         f'{_format_value(right_params[key])}')
+    for key in right_params:
+        if key not in left_params:
+            lines.append(f'+ {key}: {_format_value(right_params[key])}')
+    if lines:
+        return False, 'differs', '\n'.join(lines)
+    return True, 'same', ''
+
+
+def missing_file(path, other):
+    """Report a file that has no counterpart in the other tree."""
+    return False, 'missing', f'no counterpart {other}'
+
+
+def get_value(path, dotted):
+    """Read the value at a dotted params path."""
+    return True, 'ok', _format_value(_get(_load(path, compact=True).params, dotted))
+
+
+def set_value(path, dotted, value):
+    """Write value at a dotted params path and save the file in place."""
+    obj = _load(path)
+    _set(obj.params, dotted, value)
+    obj.save_params_yaml()
+    return True, 'set', ''
+
+
+def convert_file(path, to, force=False):
+    """Convert one file between YAML and JSON, writing it alongside.
+
+    An existing target file is only replaced if force is True.
+    """
+    import json  # pylint: disable=C0415
+
+    out_path = os.path.splitext(path)[0] + ('.json' if to == 'json' else '.yaml')
+    if not force and os.path.exists(out_path):
+        return False, 'exists', f'{out_path} already exists (use --force)'
+    if to == 'json':
+        obj = _load(path)
+        with open(out_path, 'w', encoding="utf-8") as fh:  # pylint: disable=C0103
+            json.dump({'info': obj.info, 'params': obj.params}, fh,
+                      indent=2, default=str)
+            fh.write('\n')
+    else:
+        from .yaml_params import YAMLParams  # pylint: disable=C0415
+
+        with open(path, 'r', encoding="utf-8") as fh:  # pylint: disable=C0103
+            data = json.load(fh)
+        if not isinstance(data, dict) or not isinstance(data.get('params'), dict):
+            raise ValueError('expected an object with a "params" object')
+        name = os.path.basename(path).split('.')[0]
+        obj = YAMLParams(name, params=data['params'])
+        if isinstance(data.get('info'), dict):
+            obj.set_info(data['info'])
+        obj.save_params_yaml(filepath=out_path)
+    return True, 'converted', out_path
+
+
+# Running tasks
+
+def _timed_call(task):
+    """Run task = (func, label, *args) and time it; never raises."""
+    func, label, args = task[0], task[1], task[2:]
+    start = time.perf_counter()
+    try:
+        ok, status, message = func(*args)
+    except Exception as err:  # pylint: disable=W0703
+        ok, status, message = False, 'error', f'{type(err).__name__}: {err}'
+    return label, ok, status, message, time.perf_counter() - start
+
+
+def run_tasks(tasks, jobs=None, quiet=False, out=None, err=None):
+    """Run tasks, print one timed line per file and a throughput summary.
+
+    Parameters
+    ----------
+    tasks : list of tuple
+        (func, label, *args) tuples; func must be a module-level function.
+    jobs : int, optional
+        number of worker processes; None or 0 means os.cpu_count()
+    quiet : bool, optional
+        only print lines for files that failed, by default False
+    out, err : file, optional
+        streams for per-file lines and the summary, by default stdout/stderr
+
+    Returns
+    -------
+    int
+        0 if every task succeeded, 1 otherwise.
+    """
+    out = sys.stdout if out is None else out
+    err = sys.stderr if err is None else err
+    jobs = max(1, min(jobs or os.cpu_count() or 1, len(tasks)))
+
+    start = time.perf_counter()
+    if jobs > 1:
+        from concurrent.futures import ProcessPoolExecutor  # pylint: disable=C0415
+        # Import ruamel.yaml once here so forked workers inherit it.
+        from . import yaml_params  # pylint: disable=C0415,W0611
+
+        executor = ProcessPoolExecutor(max_workers=jobs)
+        chunksize = max(1, len(tasks) // (jobs * 4))
+        results = executor.map(_timed_call, tasks, chunksize=chunksize)
+    else:
+        executor = None
+        results = map(_timed_call, tasks)
+
+    failed = 0
+    try:
+        for label, ok, status, message, elapsed in results:
+            failed += not ok
+            if quiet and ok:
+                continue
+            line = f'{status:<10}{elapsed * 1000:9.1f} ms  {label}'
+            if '\n' in message:
+                line += '\n' + '\n'.join('    ' + msg for msg in message.splitlines())
+            elif message:
+                line += f'  {message}'
+            print(line, file=out)
+    finally:
+        if executor is not None:
+            executor.shutdown()
+
+    total = time.perf_counter() - start
+    rate = len(tasks) / total if total > 0 else float('inf')
+    print(f'{len(tasks)} files, {failed} failed in {total:.2f} s '
+          f'({rate:.1f} files/s, {jobs} jobs)', file=err)
+    return 1 if failed else 0
+
+
+def find_files(paths, extensions=YAML_EXTENSIONS):
+    """Expand files and directories into a sorted list of files.
+
+    Directories are searched recursively for files with the given extensions;
+    files named explicitly are always included.
+    """
+    found = []
+    for path in paths:
+        if os.path.isdir(path):
+            for root, _, filenames in os.walk(path):
+                found.extend(os.path.join(root, filename)
+                             for filename in filenames
+                             if filename.endswith(extensions))
+        else:
+            found.append(path)
+    return sorted(found)
+
+
+def _diff_tasks(left, right):
+    if os.path.isdir(left) and os.path.isdir(right):
+        left_files = {os.path.relpath(path, left) for path in find_files([left])}
+        right_files = {os.path.relpath(path, right) for path in find_files([right])}
+        tasks = []
+        for rel in sorted(left_files | right_files):
+            left_path = os.path.join(left, rel)
+            right_path = os.path.join(right, rel)
+            if rel not in right_files:
+                tasks.append((missing_file, left_path, left_path, right_path))
+            elif rel not in left_files:
+                tasks.append((missing_file, right_path, right_path, left_path))
+            else:
+                tasks.append((diff_files, rel, left_path, right_path))
+        return tasks
+    if os.path.isdir(left) or os.path.isdir(right):
+        raise ValueError('diff needs two files or two directories')
+    return [(diff_files, f'{left} {right}', left, right)]
+
+
+def _parse_value(text):
+    """Parse a command-line value as a YAML scalar or flow collection."""
+    from ruamel.yaml import YAML  # pylint: disable=C0415
+
+    return YAML(typ='safe', pure=True).load(text)
+
+
+def _jobs(text):
+    """argparse type for --jobs: an integer >= 0."""
+    try:
+        jobs = int(text)
+    except ValueError:
+        jobs = -1
+    if jobs < 0:
+        raise argparse.ArgumentTypeError(f"invalid job count: '{text}' "
+                                         f"(use 0 for CPU count)")
+    return jobs
+
+
+def build_parser():
+    """Return the argparse parser for the yaml-params command."""
+    common = argparse.ArgumentParser(add_help=False)
+    common.add_argument('-j', '--jobs', type=_jobs, default=0,
+                        help='worker processes; 0 means CPU count (default)')
+    common.add_argument('-q', '--quiet', action='store_true',
+                        help='only report files that failed')
+
+    parser = argparse.ArgumentParser(
+        prog='yaml-params',
+        description='Validate, format, compare, query and convert '
+                    'YAMLParams files in parallel.')
+    subparsers = parser.add_subparsers(dest='command', metavar='command')
+    subparsers.required = True
+
+    def add_command(name, help_text):
+        return subparsers.add_parser(name, help=help_text, parents=[common])
+
+    sub = add_command('check', 'parse and validate files')
+    sub.add_argument('paths', nargs='+', help='files or directories')
+
+    sub = add_command('fmt', 'round-trip files, rewriting only those that change')
+    sub.add_argument('--check', action='store_true',
+                     help='do not write; fail if any file would change')
+    sub.add_argument('paths', nargs='+', help='files or directories')
+
+    sub = add_command('diff', 'compare params of two files or two directory trees')
+    sub.add_argument('left')
+    sub.add_argument('right')
+
+    sub = add_command('get', 'print the value at a dotted params path')
+    sub.add_argument('key', help='dotted path, e.g. mydict.myint')
+    sub.add_argument('paths', nargs='+', help='files or directories')
+
+    sub = add_command('set', 'set the value at a dotted params path in place')
+    sub.add_argument('key', help='dotted path, e.g. mydict.myint')
+    sub.add_argument('value', help='new value, parsed as YAML')
+    sub.add_argument('paths', nargs='+', help='files or directories')
+
+    sub = add_command('convert', 'convert between YAML and JSON, writing alongside')
+    sub.add_argument('--to', choices=('json', 'yaml'), required=True)
+    sub.add_argument('--force', action='store_true',
+                     help='overwrite existing target files')
+    sub.add_argument('paths', nargs='+', help='files or directories')
+    return parser
+
+
+def main(argv=None):
+    """Entry point for the yaml-params command."""
+    args = build_parser().parse_args(argv)
+
+    try:
+        if args.command == 'check':
+            tasks = [(check_file, path, path) for path in find_files(args.paths)]
+        elif args.command == 'fmt':
+            tasks = [(fmt_file, path, path, args.check)
+                     for path in find_files(args.paths)]
+        elif args.command == 'diff':
+            tasks = _diff_tasks(args.left, args.right)
+        elif args.command == 'get':
+            tasks = [(get_value, path, path, args.key)
+                     for path in find_files(args.paths)]
+        elif args.command == 'set':
+            value = _parse_value(args.value)
+            tasks = [(set_value, path, path, args.key, value)
+                     for path in find_files(args.paths)]
+        else:
+            sources = JSON_EXTENSIONS if args.to == 'yaml' else YAML_EXTENSIONS
+            tasks = [(convert_file, path, path, args.to, args.force)
+                     for path in find_files(args.paths, sources)]
+    except ValueError as err:
+        print(f'yaml-params: error: {err}', file=sys.stderr)
+        return 2
+
+    if not tasks:
+        print('yaml-params: no files found', file=sys.stderr)
+        return 1
+    return run_tasks(tasks, jobs=args.jobs, quiet=args.quiet)
+
+
+if __name__ == '__main__':
+    sys.exit(main())
@@ -2,6 +2,10 @@
 
 import os
 import io
+import sys
+import copy
+import threading
+import weakref
 from datetime import datetime as dt
 
 from ruamel.yaml import YAML
@@ -9,10 +13,166 @@ from ruamel.yaml.comments import CommentedMap, CommentedSeq
 from ruamel.yaml.scalarfloat import ScalarFloat
 
 
+_DATE_FORMAT = "%A, %d. %B %Y %I:%M%p"
+
+# Read-only params subtrees and formatted scalars shared between compact
+# instances, keyed by content.
+_SHARED_SUBTREES = weakref.WeakValueDictionary()
+_SHARED_SCALARS = weakref.WeakValueDictionary()
+
+
+def _new_yaml():
+    """Create a round-trip YAML engine configured for YAMLParams."""
+    yaml = YAML(typ='rt', )
+    yaml.preserve_quotes = True
+    yaml.default_flow_style = False
+    return yaml
+
+
+_THREAD_LOCAL = threading.local()
+
+
+def _thread_yaml():
+    """Return this thread's YAML engine, shared by all compact instances.
+
+    A YAML engine keeps state while dumping, so it must not be used by two
+    threads at once.
+    """
+    try:
+        return _THREAD_LOCAL.yaml
+    except AttributeError:
+        _THREAD_LOCAL.yaml = _new_yaml()
+        return _THREAD_LOCAL.yaml
+
+
+def _frozen_error(self, *args, **kwargs):
+    raise TypeError(f"shared {type(self).__name__} is read-only; use "
+                    f"YAMLParams.unshare() to get an editable copy")
+
+
+class _FrozenDict(dict):
+    """Read-only dict used for params subtrees shared between instances.
+
+    Copying or pickling yields a plain, editable dict.
+    """
+
+    __setitem__ = __delitem__ = __ior__ = _frozen_error
+    clear = pop = popitem = setdefault = update = _frozen_error
+
+    def __reduce__(self):
+        return (dict, (dict(self), ))
+
+
+class _FrozenList(list):
+    """Read-only list used for params subtrees shared between instances.
+
+    Copying or pickling yields a plain, editable list.
+    """
+
+    __setitem__ = __delitem__ = __iadd__ = __imul__ = _frozen_error
+    append = extend = insert = pop = remove = clear = _frozen_error
+    sort = reverse = _frozen_error
+
+    def __reduce__(self):
+        return (list, (list(self), ))
+
+
+_PLAIN_SCALARS = frozenset((str, int, float, bool, type(None)))
+
+# Distinct formatting states of ruamel scalars; there are only a few.
+_SCALAR_STATES = {}
+
+
+def _intern_key(key):
+    return sys.intern(key) if type(key) is str else key  # pylint: disable=C0123
+
+
+def _scalar_state(obj):
+    """Formatting state (width, precision, anchor, ...) of a ruamel scalar.
+
+    Equal states are returned as the same (shared) tuple.
+    """
+    state = []
+    for cls in type(obj).__mro__:
+        slots = getattr(cls, '__slots__', ())
+        for attr in (slots, ) if isinstance(slots, str) else slots:
+            if attr != '__weakref__' and hasattr(obj, attr):
+                state.append((attr, repr(getattr(obj, attr))))
+    state.extend(sorted((attr, repr(value))
+                        for attr, value in getattr(obj, '__dict__', {}).items()))
+    state = tuple(state)
+    return _SCALAR_STATES.setdefault(state, state)
+
+
+def _share_item(obj):
+    """Share obj (see _share()) and return it with a key identifying it.
+
+    The key is a triple of hashable values.  Values only get equal keys if
+    they would also be dumped identically, so ruamel scalar subclasses
+    include their formatting state.
+    """
+    # Subtrees are looked up by one flat tuple: the container type followed
+    # by the keys of each dict key and value, or of each list item.  Dict
+    # keys need their type too, since 1 == True.
+    if isinstance(obj, dict):
+        content_key = [dict]
+        items = []
+        for key, item in obj.items():
+            key, key_key = _share_item(_intern_key(key))
+            item, item_key = _share_item(item)
+            items.append((key, item))
+            content_key.extend(key_key)
+            content_key.extend(item_key)
+        obj = _FrozenDict(items)
+        table = _SHARED_SUBTREES
+    elif isinstance(obj, list):
+        content_key = [list]
+        items = []
+        for item in obj:
+            item, item_key = _share_item(item)
+            items.append(item)
+            content_key.extend(item_key)
+        obj = _FrozenList(items)
+        table = _SHARED_SUBTREES
+    else:
+        if isinstance(obj, float) and obj == 0:
+            # Keep 0.0 / -0.0 apart.
+            value = float.hex(obj)
+        else:
+            value = obj
+        if type(obj) in _PLAIN_SCALARS:
+            return obj, (type(obj), value, None)
+        content_key = (type(obj), value, _scalar_state(obj))
+        table = _SHARED_SCALARS
+
+    try:
+        obj = table.setdefault(tuple(content_key), obj)
+    except TypeError:
+        # Unhashable value somewhere below, or a scalar type that cannot be
+        # weakly referenced: keep obj private and identify it by content.
+        return obj, tuple(content_key)
+    # Shared values are canonical, so identity is enough.
+    return obj, (None, id(obj), None)
+
+
+def _share(obj):
+    """Return a read-only version of obj, reusing identical live values.
+
+    Dicts and lists become read-only subtrees, dict keys are interned, and
+    formatted ruamel scalars (e.g. ScalarFloat) are shared where possible.
+    """
+    return _share_item(obj)[0]
+
+
 class YAMLParams():
     """Object with YAML-saved parameters."""
 
-    def __init__(self, name, config_dir=None, params=None, load_file=True):
+    __slots__ = ('_yaml', '_compact', '_name', '_params_yaml_dir',
+                 '_params_yaml_filepath', '_source_text', '_info',
+                 '_params_yaml', 'params', '__weakref__')
+
+    def __init__(self, name, config_dir=None, params=None, load_file=True,
+                 compact=False, config_file=None):
         """YAMLParams object Initializer.
 
         Parameters
@@ -25,6 +185,15 @@ class YAMLParams():
            dictionary of parameters with which to initialize, by default None
         load_file : bool, optional
             whether or not to load from the YAML file matching config_dir/[name].yaml
+        compact : bool, optional
+            minimize per-instance memory, by default False.  Compact objects
+            share one YAML engine per thread, intern params keys, share identical
+            nested params and info blocks as read-only subtrees (see
+            unshare()), and keep only the (interned) source text between
+            dumps instead of the round-trip YAML document.
+        config_file : string, optional
+            path of the YAML file to load instead of config_dir/[name].yaml,
+            by default None
 
         Raises
         ------
@@ -32,6 +201,8 @@ class YAMLParams():
             Raised if name is not a string.
         TypeError
             Raised if config_dir is not a string.
+        TypeError
+            Raised if config_file is not a string.
         TypeError
             Raised if params is not a dict.
         """
@@ -41,24 +212,27 @@ class YAMLParams():
         if not isinstance(name, str):
             raise TypeError('YAMLParams object initialization "name" is not an '
                             'instance of string')
-        self._yaml = YAML(typ='rt', )
-        self._yaml.preserve_quotes = True
-        self._yaml.default_flow_style = False
-        self._yaml.preserve_quotes = True
+        self._compact = bool(compact)
+        self._yaml = None if self._compact else _new_yaml()
 
         # Set default values of attributes
 
-        self._name = name
+        self._name = sys.intern(name) if self._compact else name
         self._params_yaml_dir = os.path.abspath(os.path.curdir)
         self._params_yaml_filepath = \
             os.path.abspath(os.path.join(self._params_yaml_dir,
                                          self._name + '.yaml'))
-        self.create_default_params_yaml()
-        self.params = self.ryaml_to_pythonic_dict(self._params_yaml['params'])
+        self._source_text = None
+        self._info = None
+        self._params_yaml = None
+        self.params = {}
 
         # Override optional keyword arguments if not None
 
         if params is None:
+            if config_file is not None and not isinstance(config_file, str):
+                raise TypeError('YAMLParams object initialization argument '
+                                '"config_file" is not an instance of string.')
             if config_dir is not None:
                 if isinstance(config_dir, str):
                     self._params_yaml_dir = os.path.abspath(config_dir)
@@ -72,15 +246,19 @@ class YAMLParams():
                 self._params_yaml_filepath = \
                     os.path.abspath(os.path.join(self._params_yaml_dir,
                                                 self._name + '.yaml'))
-                self.params = self.ryaml_to_pythonic_dict(self._params_yaml['params'])
             if load_file is True:
-                self.read_params_config()
+                self.read_params_config(config_file=config_file)
+            else:
+                self.create_default_params_yaml()
         else:
             if isinstance(params, dict):
                 self.create_default_params_yaml(kind="PASSED_PARAM_DICT")
-                self.params = params
-                self.capture_params()
-                self.params = self.ryaml_to_pythonic_dict(self._params_yaml['params'])
+                if self._compact:
+                    self.params = self._share_params(params)
+                else:
+                    self.params = params
+                    self.capture_params()
+                    self.params = self.ryaml_to_pythonic_dict(self._params_yaml['params'])
             else:
                 raise TypeError('YAMLParams object initialization "params" is '
                                 'not an instance of dict.')
@@ -96,11 +274,12 @@ class YAMLParams():
         str
             YAML file formatted string with contents of self._params_yaml
         """
-        self.capture_params()
+        self._capture_params_yaml()
         buf = io.StringIO()
-        self._yaml.dump(self._params_yaml, buf)
+        self._engine().dump(self._params_yaml, buf)
         out = buf.getvalue()
         buf.close()
+        self._release_params_yaml()
         return out
 
     def save_params_yaml(self, filepath=None):
@@ -115,21 +294,32 @@ class YAMLParams():
         filepath : str, optional
             filepath to which to save params contents, by default None
         """
-        self.capture_params()
+        self._capture_params_yaml()
         if filepath is None:
 
             with open(self._params_yaml_filepath,'w', encoding="utf-8") as fh:  # pylint: disable=C0103
-                self._yaml.dump(self._params_yaml, fh)
+                self._engine().dump(self._params_yaml, fh)
         else:
 
             with open(filepath, 'w', encoding="utf-8") as fh:  # pylint: disable=C0103
-                self._yaml.dump(self._params_yaml, fh)
+                self._engine().dump(self._params_yaml, fh)
+        self._release_params_yaml()
 
 
     def capture_params(self):
         """Translate the plain Python-typed self.params to the ruamel.yaml-typed 
         self._params_yaml.
+
+        Compact objects do not keep self._params_yaml, so for them this only
+        checks that params can be captured.
         """
+        self._capture_params_yaml()
+        self._release_params_yaml()
+
+
+    def _capture_params_yaml(self):
+        """capture_params() without releasing the document afterwards."""
+        self._materialize_params_yaml()
         self._params_yaml['params'] = self.merge_params_into_yaml(self.params, 
                                                                 self._params_yaml['params'])
 
@@ -144,16 +334,25 @@ class YAMLParams():
         """
         if config_file is not None:
             with open(config_file, 'r', encoding="utf-8") as fh:  # pylint: disable=C0103
-                self._params_yaml = self._yaml.load(fh)
+                text = fh.read()
 
             self._params_yaml_filepath = os.path.abspath(config_file)
             self._params_yaml_dir, filename = os.path.split(self._params_yaml_filepath)
             self._name = filename.split('.')[0]
         else:
             with open(self._params_yaml_filepath, 'r', encoding="utf-8") as fh:  # pylint: disable=C0103
-                self._params_yaml = self._yaml.load(fh)
+                text = fh.read()
 
+        self._params_yaml = self._engine().load(text)
         self.params = self.ryaml_to_pythonic_dict(self._params_yaml['params'])
+        if self._compact:
+            # Keep the text, not the file path: the file may change later.
+            self._source_text = sys.intern(text)
+            self._params_yaml_dir = sys.intern(self._params_yaml_dir)
+            self._info = _share(self.ryaml_to_pythonic_dict(
+                self._params_yaml.get('info', {})))
+            self.params = self._share_params(self.params)
+            self._release_params_yaml()
 
 
     def create_default_params_yaml(self, kind='SELF_GENERATED'):
@@ -162,30 +361,135 @@ class YAMLParams():
         This creates an empty params dict and a pre-formatted "info" block
         for when the YAML file is saved.  
 
+        Compact objects only keep the "info" block, shared read-only with
+        other objects that have the same name, kind and date; the document is
+        built when it is first needed.
+
         Parameters
         ----------
         kind : str, optional
             the kind of data generated, by default "SELF_GENERATED"
         """
+        info = {
+            'name': self._name,
+            'version': "v0.1.0",
+            'date': dt.now().strftime(_DATE_FORMAT),
+            'author': f"YAMLParams class, kind: {kind}",
+            'description': "Test parametters for developing YAMLParams class.",
+        }
+        self._source_text = None
+        if self._compact:
+            self._info = _share(info)
+            self._params_yaml = None
+        else:
+            self._info = None
+            self._params_yaml = self._build_default_params_yaml(info)
+
+
+    @property
+    def info(self):
+        """Copy of the "info" block as plain Python types; see set_info()."""
+        if self._compact:
+            return copy.deepcopy(self._info)
+        return self.ryaml_to_pythonic_dict(self._params_yaml.get('info', {}))
+
+
+    def set_info(self, info):
+        """Replace the "info" block, keeping comments on the keys that remain.
+
+        Parameters
+        ----------
+        info : dict
+            new contents of the "info" block
+
+        Raises
+        ------
+        TypeError
+            Raised if info is not a dict.
+        """
+        if not isinstance(info, dict):
+            raise TypeError('YAMLParams.set_info() "info" is not an instance '
+                            'of dict.')
+        if self._compact:
+            self._info = _share(info)
+        else:
+            self._replace_info(info)
+
+
+    def _replace_info(self, info):
+        """Merge info into self._params_yaml['info'], dropping other keys."""
+        yaml_info = self._params_yaml.get('info')
+        if isinstance(yaml_info, CommentedMap):
+            for key in [key for key in yaml_info if key not in info]:
+                del yaml_info[key]
+        else:
+            yaml_info = CommentedMap()
+        self._params_yaml['info'] = self.merge_params_into_yaml(info, yaml_info)
+
+
+    def unshare(self, key):
+        """Replace a shared read-only params subtree with an editable copy.
+
+        Only needed for compact objects, whose nested dicts and lists may be
+        shared with other objects.
+
+        Parameters
+        ----------
+        key : str
+            top-level key in self.params
+
+        Returns
+        -------
+        object
+            the editable value now stored at self.params[key]
+        """
+        self.params[key] = copy.deepcopy(self.params[key])
+        return self.params[key]
+
+
+    def _engine(self):
+        """Return the YAML engine to use for this object."""
+        return _thread_yaml() if self._yaml is None else self._yaml
+
+
+    def _share_params(self, params):
+        """Intern the keys of params and share its subtrees read-only."""
+        return {_intern_key(key): _share(item) for key, item in params.items()}
+
+
+    def _materialize_params_yaml(self):
+        """Build self._params_yaml if a compact object released it."""
+        if self._params_yaml is not None:
+            return
+        if self._source_text is None:
+            self._params_yaml = self._build_default_params_yaml(copy.deepcopy(self._info))
+        else:
+            self._params_yaml = self._engine().load(self._source_text)
+            if self._info != self.ryaml_to_pythonic_dict(self._params_yaml.get('info', {})):
+                self._replace_info(self._info)
+
+
+    def _release_params_yaml(self):
+        """Drop self._params_yaml on compact objects; params holds the data."""
+        if self._compact:
+            self._params_yaml = None
+
 
+    def _build_default_params_yaml(self, info):
+        """Return the default round-trip document with the given info block."""
         yaml_dict = {
-            'info': {
-                'name': self._name,
-                'version': "v0.1.0",
-                'date': dt.now().strftime("%A, %d. %B %Y %I:%M%p"),
-                'author': f"YAMLParams class, kind: {kind}",
-                'description': "Test parametters for developing YAMLParams class.",
-            },
+            'info': info,
             'params': {
             }
         }
         buf = io.StringIO()
-        self._yaml.dump(yaml_dict, buf)
-        self._params_yaml=self._yaml.load(buf.getvalue())
+        self._engine().dump(yaml_dict, buf)
+        params_yaml = self._engine().load(buf.getvalue())
         buf.close()
-        self._params_yaml.yaml_set_start_comment(f"Parameters (params) for "
-                                                 f"YAMLParams object "
-                                                 f"'{self._name}'.")
+        params_yaml.yaml_set_start_comment(f"Parameters (params) for "
+                                           f"YAMLParams object "
+                                           f"'{self._name}'.")
+        return params_yaml
 
 
     def ryaml_to_pythonic_dict(self, obj):
@@ -241,7 +545,8 @@ class YAMLParams():
                     yaml_obj[key] = \
                         self.merge_params_into_yaml(item, yaml_obj[key])
                 else:
-                    yaml_obj[key] = self.merge_params_into_yaml(item, type(item)() )
+                    new_obj = dict() if isinstance(item, _FrozenDict) else type(item)()
+                    yaml_obj[key] = self.merge_params_into_yaml(item, new_obj)
         elif isinstance(param_obj, list):
             # print('found list!')
             yaml_obj = [None]
@@ -251,8 +556,8 @@ class YAMLParams():
                                       param_obj, yaml_obj))
             
             buf = io.StringIO()
-            self._yaml.dump(yaml_obj, buf)
-            yaml_obj = self._yaml.load(buf.getvalue())
+            self._engine().dump(yaml_obj, buf)
+            yaml_obj = self._engine().load(buf.getvalue())
             buf.close()
             
             yaml_obj.fa.set_flow_style()